@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 import enum
 import os
+import shlex
 from datetime import timedelta
+from typing import Dict
 from typing import Iterable
 from typing import List
 from typing import Optional
@@ -29,6 +31,9 @@ from _pytest.mark.structures import ParameterSet
 from bci_tester.runtime_choice import DOCKER_SELECTED
 
 
+#: The architecture of the host, cached so that it is only queried once
+_ARCH = LOCALHOST.system_info.arch
+
 #: The operating system version as present in /etc/os-release & various other
 #: places
 OS_VERSION = os.getenv("OS_VERSION", "15.5")
@@ -196,10 +201,14 @@ BCI_DEVEL_REPO = os.getenv("BCI_DEVEL_REPO")
 
 
 if BCI_DEVEL_REPO is None:
-    BCI_DEVEL_REPO = f"https://updates.suse.com/SUSE/Products/SLE-BCI/{OS_MAJOR_VERSION}-SP{OS_SP_VERSION}/{LOCALHOST.system_info.arch}/product/"
+    BCI_DEVEL_REPO = f"https://updates.suse.com/SUSE/Products/SLE-BCI/{OS_MAJOR_VERSION}-SP{OS_SP_VERSION}/{_ARCH}/product/"
     _BCI_REPLACE_REPO_CONTAINERFILE = ""
 else:
-    _BCI_REPLACE_REPO_CONTAINERFILE = f"RUN sed -i 's|baseurl.*|baseurl={BCI_DEVEL_REPO}|' /etc/zypp/repos.d/{BCI_REPO_NAME}.repo"
+    _BCI_REPLACE_REPO_CONTAINERFILE = (
+        "RUN sed -i "
+        + shlex.quote(f"s|baseurl.*|baseurl={BCI_DEVEL_REPO}|")
+        + f" /etc/zypp/repos.d/{BCI_REPO_NAME}.repo"
+    )
 
 
 _IMAGE_TYPE_T = Literal["dockerfile", "kiwi"]
@@ -219,6 +228,14 @@ def _get_repository_name(image_type: _IMAGE_TYPE_T) -> str:
     raise AssertionError(f"invalid image_type: {image_type}")
 
 
+#: registry url prefix (including the repository name) of the images for each
+#: image type
+_REGISTRY_PREFIX: Dict[_IMAGE_TYPE_T, str] = {
+    image_type: f"{BASEURL}/{_get_repository_name(image_type)}"
+    for image_type in ("dockerfile", "kiwi")
+}
+
+
 @enum.unique
 class ImageType(enum.Enum):
     """BCI type enumeration defining to which BCI class this container image
@@ -275,10 +292,7 @@ def create_BCI(
             of the :py:class:`~pytest_container.DerivedContainer`
     """
     build_tag_base = build_tag.rpartition("/")[2]
-    marks = []
-    if extra_marks:
-        for m in extra_marks:
-            marks.append(m)
+    marks = list(extra_marks) if extra_marks else []
 
     # Ironbank currently has only the "bci-base" image and nothing else, so
     # skip all other tests
@@ -307,20 +321,13 @@ def create_BCI(
     # only try to grab the mark from the build tag for containers that are
     # available for this os version, otherwise we get bogus errors for missing
     # marks
-    if OS_VERSION in (
-        available_versions or list(_DEFAULT_NONBASE_OS_VERSIONS)
-    ):
+    if OS_VERSION in (available_versions or _DEFAULT_NONBASE_OS_VERSIONS):
         marks.append(pytest.mark.__getattr__(build_tag_base.replace(":", "_")))
 
-    if OS_VERSION == "tumbleweed":
-        if bci_type == ImageType.APPLICATION:
-            baseurl = (
-                f"{BASEURL}/{_get_repository_name(image_type)}{build_tag}"
-            )
-        else:
-            baseurl = f"{BASEURL}/{_get_repository_name(image_type)}opensuse/{build_tag}"
+    if OS_VERSION == "tumbleweed" and bci_type != ImageType.APPLICATION:
+        baseurl = f"{_REGISTRY_PREFIX[image_type]}opensuse/{build_tag}"
     else:
-        baseurl = f"{BASEURL}/{_get_repository_name(image_type)}{build_tag}"
+        baseurl = f"{_REGISTRY_PREFIX[image_type]}{build_tag}"
 
     return pytest.param(
         DerivedContainer(
@@ -495,7 +502,7 @@ RUBY_33_CONTAINER = create_BCI(
 RUBY_CONTAINERS = [RUBY_25_CONTAINER, RUBY_33_CONTAINER]
 
 _DOTNET_SKIP_ARCH_MARK = pytest.mark.skipif(
-    LOCALHOST.system_info.arch != "x86_64",
+    _ARCH != "x86_64",
     reason="The .Net containers are only available on x86_64",
 )
 
@@ -704,14 +711,20 @@ TOMCAT_9_CONTAINER, TOMCAT_10_CONTAINER = [
 ]
 TOMCAT_CONTAINERS = [TOMCAT_9_CONTAINER, TOMCAT_10_CONTAINER]
 
-DOTNET_CONTAINERS = [
-    DOTNET_SDK_6_0_CONTAINER,
-    DOTNET_SDK_8_0_CONTAINER,
-    DOTNET_ASPNET_6_0_CONTAINER,
-    DOTNET_ASPNET_8_0_CONTAINER,
-    DOTNET_RUNTIME_6_0_CONTAINER,
-    DOTNET_RUNTIME_8_0_CONTAINER,
-]
+#: The .Net containers, only populated on x86_64 as they are not available on
+#: other architectures
+DOTNET_CONTAINERS = (
+    (
+        DOTNET_SDK_6_0_CONTAINER,
+        DOTNET_SDK_8_0_CONTAINER,
+        DOTNET_ASPNET_6_0_CONTAINER,
+        DOTNET_ASPNET_8_0_CONTAINER,
+        DOTNET_RUNTIME_6_0_CONTAINER,
+        DOTNET_RUNTIME_8_0_CONTAINER,
+    )
+    if _ARCH == "x86_64"
+    else ()
+)
 
 SPACK_CONTAINERS = [
     create_BCI(
@@ -722,33 +735,31 @@ SPACK_CONTAINERS = [
 ]
 
 CONTAINERS_WITH_ZYPPER = (
-    [
-        BASE_CONTAINER,
-        NGINX_CONTAINER,
-        NODEJS_18_CONTAINER,
-        NODEJS_20_CONTAINER,
-        INIT_CONTAINER,
-        PHP_8_APACHE,
-        PHP_8_CLI,
-        PHP_8_FPM,
-        KERNEL_MODULE_CONTAINER,
-    ]
-    + PCP_CONTAINERS
-    + LTSS_BASE_CONTAINERS
-    + LTSS_BASE_FIPS_CONTAINERS
-    + CONTAINER_389DS_CONTAINERS
-    + PYTHON_CONTAINERS
-    + RUBY_CONTAINERS
-    + GCC_CONTAINERS
-    + GOLANG_CONTAINERS
-    + RUST_CONTAINERS
-    + OPENJDK_CONTAINERS
-    + MARIADB_CONTAINERS
-    + MARIADB_CLIENT_CONTAINERS
-    + POSTGRESQL_CONTAINERS
-    + SPACK_CONTAINERS
-    + TOMCAT_CONTAINERS
-    + (DOTNET_CONTAINERS if LOCALHOST.system_info.arch == "x86_64" else [])
+    BASE_CONTAINER,
+    NGINX_CONTAINER,
+    NODEJS_18_CONTAINER,
+    NODEJS_20_CONTAINER,
+    INIT_CONTAINER,
+    PHP_8_APACHE,
+    PHP_8_CLI,
+    PHP_8_FPM,
+    KERNEL_MODULE_CONTAINER,
+    *PCP_CONTAINERS,
+    *LTSS_BASE_CONTAINERS,
+    *LTSS_BASE_FIPS_CONTAINERS,
+    *CONTAINER_389DS_CONTAINERS,
+    *PYTHON_CONTAINERS,
+    *RUBY_CONTAINERS,
+    *GCC_CONTAINERS,
+    *GOLANG_CONTAINERS,
+    *RUST_CONTAINERS,
+    *OPENJDK_CONTAINERS,
+    *MARIADB_CONTAINERS,
+    *MARIADB_CLIENT_CONTAINERS,
+    *POSTGRESQL_CONTAINERS,
+    *SPACK_CONTAINERS,
+    *TOMCAT_CONTAINERS,
+    *DOTNET_CONTAINERS,
 )
 
 #: all containers with zypper and with the flag to launch them as root
@@ -773,14 +784,14 @@ for param in CONTAINERS_WITH_ZYPPER:
         )
 
 
-CONTAINERS_WITHOUT_ZYPPER = [
+CONTAINERS_WITHOUT_ZYPPER = (
     MINIMAL_CONTAINER,
     MICRO_CONTAINER,
     BUSYBOX_CONTAINER,
     HELM_CONTAINER,
     GIT_CONTAINER,
     DISTRIBUTION_CONTAINER,
-]
+)
 
 #: Containers with L3 support
 # Tumbleweed has no concept of l3 support
@@ -789,32 +800,30 @@ if OS_VERSION in ("15.6", "tumbleweed"):
     L3_CONTAINERS = ()
 else:
     L3_CONTAINERS = (
-        [
-            BASE_CONTAINER,
-            MINIMAL_CONTAINER,
-            MICRO_CONTAINER,
-            GIT_CONTAINER,
-            INIT_CONTAINER,
-            BUSYBOX_CONTAINER,
-            DISTRIBUTION_CONTAINER,
-            NGINX_CONTAINER,
-            HELM_CONTAINER,
-            PHP_8_CLI,
-            PHP_8_APACHE,
-            PHP_8_FPM,
-        ]
-        + PCP_CONTAINERS
-        + LTSS_BASE_CONTAINERS
-        + LTSS_BASE_FIPS_CONTAINERS
-        + CONTAINER_389DS_CONTAINERS
-        + PYTHON_CONTAINERS
-        + RUBY_CONTAINERS
-        + GOLANG_CONTAINERS
-        + NODEJS_CONTAINERS
-        + RUST_CONTAINERS
-        + OPENJDK_CONTAINERS
-        + MARIADB_CLIENT_CONTAINERS
-        + MARIADB_CONTAINERS
+        BASE_CONTAINER,
+        MINIMAL_CONTAINER,
+        MICRO_CONTAINER,
+        GIT_CONTAINER,
+        INIT_CONTAINER,
+        BUSYBOX_CONTAINER,
+        DISTRIBUTION_CONTAINER,
+        NGINX_CONTAINER,
+        HELM_CONTAINER,
+        PHP_8_CLI,
+        PHP_8_APACHE,
+        PHP_8_FPM,
+        *PCP_CONTAINERS,
+        *LTSS_BASE_CONTAINERS,
+        *LTSS_BASE_FIPS_CONTAINERS,
+        *CONTAINER_389DS_CONTAINERS,
+        *PYTHON_CONTAINERS,
+        *RUBY_CONTAINERS,
+        *GOLANG_CONTAINERS,
+        *NODEJS_CONTAINERS,
+        *RUST_CONTAINERS,
+        *OPENJDK_CONTAINERS,
+        *MARIADB_CLIENT_CONTAINERS,
+        *MARIADB_CONTAINERS,
     )
 
 ACC_CONTAINERS = POSTGRESQL_CONTAINERS
@@ -1,12 +1,17 @@
 import os
 import shlex
+import subprocess
 import tempfile
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import check_output
+from typing import Set
 
 import pytest
 from _pytest.fixtures import SubRequest
 from pytest_container import auto_container_parametrize
+from pytest_container import Container
+from pytest_container import DerivedContainer
 from pytest_container import get_selected_runtime
 from pytest_container import GitRepositoryBuild
 from pytest_container import Version
@@ -113,12 +118,66 @@ def pytest_generate_tests(metafunc):
 def pytest_addoption(parser):
     add_extra_run_and_build_args_options(parser)
     add_logging_level_options(parser)
+    parser.addoption(
+        "--prepull-images",
+        action="store_true",
+        default=False,
+        help="Pull the images of all selected tests in parallel before the "
+        "first test runs",
+    )
 
 
 def pytest_configure(config):
     set_logging_level_from_cli_args(config)
 
 
+def _has_true_skip_mark(item: pytest.Item) -> bool:
+    for mark in item.iter_markers():
+        if mark.name == "skip" or (
+            mark.name == "skipif" and mark.args and mark.args[0] is True
+        ):
+            return True
+    return False
+
+
+@pytest.fixture(scope="session", autouse=True)
+def prepull_images(request: SubRequest):
+    """Pulls the base images of all containers that are used by the selected
+    and not skipped tests in parallel, if ``--prepull-images`` was passed.
+
+    Otherwise every image is pulled by the container fixture on first use,
+    i.e. serially.
+    """
+    if not request.config.getoption("prepull_images"):
+        return
+
+    urls: Set[str] = set()
+    for item in request.session.items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is None or _has_true_skip_mark(item):
+            continue
+        for param in callspec.params.values():
+            if isinstance(param, (Container, DerivedContainer)):
+                url = param.get_base().url
+                if url:
+                    urls.add(url)
+
+    runtime = get_selected_runtime()
+
+    def pull(url: str) -> None:
+        # failures are ignored here, the container fixture will pull the image
+        # again and report the error for the test that needs it
+        subprocess.run(
+            [runtime.runner_binary, "pull", url],
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(pull, sorted(urls)))
+
+
 @pytest.fixture(scope="module")
 def dapper(host):
     """Fixture that ensures that dapper is installed on the host system and
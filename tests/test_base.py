@@ -4,6 +4,7 @@ registry.suse.com)
 """
 
 from typing import Dict
+from typing import Tuple
 
 import pytest
 from pytest_container import DerivedContainer
@@ -24,11 +25,54 @@ from bci_tester.runtime_choice import PODMAN_SELECTED
 from tests.test_fips import openssl_fips_hashes_test_fnct
 
 
-CONTAINER_IMAGES = [
+CONTAINER_IMAGES = (
     BASE_CONTAINER,
     *LTSS_BASE_CONTAINERS,
     *LTSS_BASE_FIPS_CONTAINERS,
-]
+)
+
+# the container params are not hashable, so compare them by identity
+_LTSS_BASE_FIPS_CONTAINER_IDS = frozenset(map(id, LTSS_BASE_FIPS_CONTAINERS))
+
+#: The architecture of the host
+_ARCH = LOCALHOST.system_info.arch
+
+#: size limits of the base container in MiB, indexed by the os version bucket
+#: (see :py:func:`_base_container_size_bucket`) and the architecture
+# 15.5/15.6 are hopefully only temporary large due to PED-5014
+_BASE_CONTAINER_MAX_SIZE: Dict[Tuple[str, str], int] = {
+    ("tw", "x86_64"): 132,
+    ("tw", "aarch64"): 158,
+    ("tw", "ppc64le"): 179,
+    ("tw", "s390x"): 136,
+    ("15.6", "x86_64"): 139,
+    ("15.6", "aarch64"): 160,
+    ("15.6", "ppc64le"): 184,
+    ("15.6", "s390x"): 141,
+    ("15.5", "x86_64"): 124,
+    ("15.5", "aarch64"): 143,
+    ("15.5", "ppc64le"): 165,
+    ("15.5", "s390x"): 127,
+    ("default", "x86_64"): 120,
+    ("default", "aarch64"): 140,
+    ("default", "ppc64le"): 160,
+    ("default", "s390x"): 125,
+}
+
+
+def _base_container_size_bucket(is_fips_ctr: bool) -> str:
+    """Returns the key into :py:const:`_BASE_CONTAINER_MAX_SIZE` for the
+    current :py:const:`~bci_tester.data.OS_VERSION`.
+
+    """
+    # the FIPS container is bigger too than the 15 SP3 base image
+    if OS_VERSION in ("basalt", "tumbleweed") or is_fips_ctr:
+        return "tw"
+    if OS_VERSION == "15.6":
+        return "15.6"
+    if OS_VERSION in ("15.4", "15.5"):
+        return "15.5"
+    return "default"
 
 
 def test_passwd_present(auto_container):
@@ -56,11 +100,10 @@ def test_iconv_working(auto_container):
 )
 def test_base_size(auto_container: ContainerData, container_runtime):
     """Ensure that the container's size is below the limits specified in
-    :py:const:`base_container_max_size`
+    :py:const:`_BASE_CONTAINER_MAX_SIZE`
 
     """
 
-    # the FIPS container is bigger too than the 15 SP3 base image
     is_fips_ctr = (
         auto_container.container.baseurl
         and auto_container.container.baseurl.rpartition("/")[2].startswith(
@@ -68,61 +111,44 @@ def test_base_size(auto_container: ContainerData, container_runtime):
         )
     )
 
-    #: size limits of the base container per arch in MiB
-    # 15.5/15.6 are hopefully only temporary large due to PED-5014
-    if OS_VERSION in ("basalt", "tumbleweed") or is_fips_ctr:
-        base_container_max_size: Dict[str, int] = {
-            "x86_64": 132,
-            "aarch64": 158,
-            "ppc64le": 179,
-            "s390x": 136,
-        }
-    elif OS_VERSION in ("15.6",):
-        base_container_max_size: Dict[str, int] = {
-            "x86_64": 139,
-            "aarch64": 160,
-            "ppc64le": 184,
-            "s390x": 141,
-        }
-    elif OS_VERSION in ("15.4", "15.5"):
-        base_container_max_size: Dict[str, int] = {
-            "x86_64": 124,
-            "aarch64": 143,
-            "ppc64le": 165,
-            "s390x": 127,
-        }
-    else:
-        base_container_max_size: Dict[str, int] = {
-            "x86_64": 120,
-            "aarch64": 140,
-            "ppc64le": 160,
-            "s390x": 125,
-        }
     container_size = container_runtime.get_image_size(
         auto_container.image_url_or_id
     ) // (1024 * 1024)
-    max_container_size = base_container_max_size[LOCALHOST.system_info.arch]
+    max_container_size = _BASE_CONTAINER_MAX_SIZE[
+        (_base_container_size_bucket(bool(is_fips_ctr)), _ARCH)
+    ]
     assert container_size <= max_container_size, (
-        f"Base container size is {container_size} MiB for {LOCALHOST.system_info.arch} "
-        f"(expected max of {base_container_max_size[LOCALHOST.system_info.arch]} MiB)"
+        f"Base container size is {container_size} MiB for {_ARCH} "
+        f"(expected max of {max_container_size} MiB)"
     )
 
 
+#: whether the host runs in FIPS mode or the target enforces it
+_FIPS_ACTIVE = host_fips_enabled() or target_fips_enforced()
+
 without_fips = pytest.mark.skipif(
-    host_fips_enabled() or target_fips_enforced(),
+    _FIPS_ACTIVE,
     reason="host running in FIPS 140 mode",
 )
 
+#: error message of :command:`openssl gost` (openssl-3 no longer knows the
+#: ``gost`` command at all)
+_GOST_ERROR_MESSAGE = (
+    "Invalid command 'gost'"
+    if OS_VERSION in ("basalt", "tumbleweed", "15.6")
+    else "gost is not a known digest"
+)
+
+#: shell command hashing :file:`/dev/null` with all digests in a single exec
+_ALL_DIGESTS_CMD = " && ".join(
+    f"openssl {digest} /dev/null" for digest in ALL_DIGESTS
+)
+
 
 def test_gost_digest_disable(auto_container):
     """Checks that the gost message digest is not known to openssl."""
-    openssl_error_message = (
-        "Invalid command 'gost'"
-        if OS_VERSION in ("basalt", "tumbleweed", "15.6")
-        else "gost is not a known digest"
-    )
     assert (
-        openssl_error_message
+        _GOST_ERROR_MESSAGE
         in auto_container.connection.run_expect(
             [1], "openssl gost /dev/null"
         ).stderr.strip()
@@ -132,7 +158,11 @@ def test_gost_digest_disable(auto_container):
 @without_fips
 @pytest.mark.parametrize(
     "container",
-    [c for c in CONTAINER_IMAGES if c not in LTSS_BASE_FIPS_CONTAINERS],
+    [
+        c
+        for c in CONTAINER_IMAGES
+        if id(c) not in _LTSS_BASE_FIPS_CONTAINER_IDS
+    ],
     indirect=True,
 )
 def test_openssl_hashes(container):
@@ -140,15 +170,12 @@ def test_openssl_hashes(container):
     algorithms work via :command:`openssl $digest /dev/null`.
 
     """
-    for digest in ALL_DIGESTS:
-        container.connection.run_expect([0], f"openssl {digest} /dev/null")
+    container.connection.run_expect([0], _ALL_DIGESTS_CMD)
 
 
-@pytest.mark.parametrize(
-    "container_per_test", [*LTSS_BASE_FIPS_CONTAINERS], indirect=True
-)
-def test_openssl_fips_hashes(container_per_test):
-    openssl_fips_hashes_test_fnct(container_per_test)
+@pytest.mark.parametrize("container", LTSS_BASE_FIPS_CONTAINERS, indirect=True)
+def test_openssl_fips_hashes(container):
+    openssl_fips_hashes_test_fnct(container)
 
 
 def test_all_openssl_hashes_known(auto_container):
@@ -167,7 +194,7 @@ def test_all_openssl_hashes_known(auto_container):
     # openssl-3 reduces the listed digests in FIPS mode, openssl 1.x does not
 
     if OS_VERSION in ("basalt", "tumbleweed", "15.6"):
-        if host_fips_enabled() or target_fips_enforced():
+        if _FIPS_ACTIVE:
             expected_digest_list = FIPS_DIGESTS
 
     # gost is not supported to generate digests, but it appears in:
@@ -178,15 +205,17 @@ def test_all_openssl_hashes_known(auto_container):
     assert set(hashes) == set(expected_digest_list)
 
 
+_BASE_CTR = container_from_pytest_param(BASE_CONTAINER)
+
 #: This is the base container with additional launch arguments applied to it so
 #: that docker can be launched inside the container
 DIND_CONTAINER = pytest.param(
     DerivedContainer(
-        base=container_from_pytest_param(BASE_CONTAINER),
+        base=_BASE_CTR,
         **{
-            x: getattr(BASE_CONTAINER.values[0], x)
-            for x in BASE_CONTAINER.values[0].__dict__
-            if x not in ("extra_launch_args", "base")
+            k: v
+            for k, v in vars(_BASE_CTR).items()
+            if k not in ("extra_launch_args", "base")
         },
         extra_launch_args=[
             "--privileged=true",